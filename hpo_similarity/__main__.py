@@ -65,6 +65,8 @@ def get_options():
     parser.add_argument("--iterations", type=int, default=100000,
         help="whether to permute the probands across genes, in order to assess \
             method robustness.")
+    parser.add_argument("--processes", type=int, default=1,
+        help="number of processes to test genes with (default=1).")
     
     # allow for using different similarity scoring metrics
     group = parser.add_mutually_exclusive_group()
@@ -110,7 +112,8 @@ def main():
     print("analysing similarity")
     try:
         analyse_genes(graph, hpo_by_proband, probands_by_gene, \
-            options.output, options.iterations, options.score_type)
+            options.output, options.iterations, options.score_type,
+            options.processes)
     except KeyboardInterrupt:
         sys.exit("HPO similarity exited.")
 
@@ -19,10 +19,50 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import random
+from multiprocessing import Pool
+
 from hpo_similarity.check_proband_terms import check_terms_in_graph
 from hpo_similarity.test_similarity import test_similarity
 
-def analyse_genes(hpo_graph, hpo_by_proband, probands_by_gene, output_path, iterations, score_type):
+# data shared by the genes tested within a worker process, set once per worker
+# so that the HPO graph isn't sent to the worker alongside every gene
+WORKER_DATA = {}
+
+def init_worker(hpo_graph, hpo_by_proband, iterations, score_type):
+    """ set up a worker process for testing genes in parallel
+    
+    Args:
+        hpo_graph: ICSimilarity object for the HPO term graph
+        hpo_by_proband: dictionary of HPO terms per proband
+        iterations: number of iterations to run.
+        score_type: type of similarity metric to use
+    """
+    
+    # forked workers inherit the parent's random state, so reseed each worker,
+    # otherwise every worker would simulate the same sequence of probands
+    random.seed()
+    
+    WORKER_DATA["hpo_graph"] = hpo_graph
+    WORKER_DATA["hpo_by_proband"] = hpo_by_proband
+    WORKER_DATA["iterations"] = iterations
+    WORKER_DATA["score_type"] = score_type
+
+def get_gene_p_value(probands):
+    """ test the similarity of the probands for a gene within a worker process
+    
+    Args:
+        probands: list of proband IDs with variants in a gene.
+    
+    Returns:
+        P value for the similarity of the probands' HPO terms, or None.
+    """
+    
+    return test_similarity(WORKER_DATA["hpo_graph"],
+        WORKER_DATA["hpo_by_proband"], probands, WORKER_DATA["iterations"],
+        WORKER_DATA["score_type"])
+
+def analyse_genes(hpo_graph, hpo_by_proband, probands_by_gene, output_path, iterations, score_type, processes=1):
     """ tests genes to see if their probands share HPO terms more than by chance.
     
     Args:
@@ -34,6 +74,8 @@ def analyse_genes(hpo_graph, hpo_by_proband, probands_by_gene, output_path, iter
             in those genes.
         output_path: path to file to write the results to, or sys.stdout object.
         iterations: number of iterations to run.
+        processes: number of processes to test genes with. Genes are tested
+            independently, so they can be spread across several processes.
     """
     
     check_terms_in_graph(hpo_graph, hpo_by_proband)
@@ -46,16 +88,28 @@ def analyse_genes(hpo_graph, hpo_by_proband, probands_by_gene, output_path, iter
     
     output.write("hgnc\thpo_similarity_p_value\n")
     
-    for gene in sorted(probands_by_gene):
-        probands = probands_by_gene[gene]
-        
-        p_value = None
-        if len(probands) > 1:
-            p_value = test_similarity(hpo_graph, hpo_by_proband, probands, iterations, score_type)
-        
-        if p_value is None:
-            continue
-        
-        output.write("{0}\t{1}\n".format(gene, p_value))
+    genes = [x for x in sorted(probands_by_gene) if len(probands_by_gene[x]) > 1]
+    probands = [probands_by_gene[x] for x in genes]
+    
+    pool = None
+    if processes > 1:
+        pool = Pool(processes, initializer=init_worker,
+            initargs=(hpo_graph, hpo_by_proband, iterations, score_type))
+        p_values = pool.imap(get_gene_p_value, probands)
+    else:
+        p_values = (test_similarity(hpo_graph, hpo_by_proband, x, iterations,
+            score_type) for x in probands)
     
-    output.close()
+    # make sure the output is closed, and any worker processes are stopped,
+    # even if testing is interrupted
+    try:
+        for gene, p_value in zip(genes, p_values):
+            if p_value is None:
+                continue
+            
+            output.write("{0}\t{1}\n".format(gene, p_value))
+    finally:
+        if pool is not None:
+            pool.terminate()
+        
+        output.close()
@@ -24,9 +24,11 @@ from __future__ import division
 def get_resnik_score(hpo_graph, proband_1, proband_2):
     """ Calculate the similarity in HPO terms between terms for two probands.
     
-    This runs through the pairs of HPO terms from the two probands and finds
-    the information content for the most informative common ancestor for each
-    pair. We return the largest of these IC scores, known as the maxIC.
+    This finds the ancestors of each proband's HPO terms, and returns the
+    largest information content among the ancestors shared by the two
+    probands. That equals the largest IC of the most informative common
+    ancestor across every pair of terms from the two probands, known as the
+    maxIC.
     
     Reference:
         Resnik, J Artif Intell Res (1999), 11:95-130.
@@ -42,12 +44,16 @@ def get_resnik_score(hpo_graph, proband_1, proband_2):
         A score for how similar the terms are between the two probands.
     """
     
-    ic = []
-    for term_1 in proband_1:
-        for term_2 in proband_2:
-            ic.append(hpo_graph.get_most_informative_ic(term_1, term_2))
+    # A common ancestor of any pair of terms is an ancestor of both probands,
+    # and each ancestor shared by the probands is a common ancestor of some
+    # pair of their terms. So rather than finding the most informative common
+    # ancestor for every pair of terms, we only need the most informative of the
+    # ancestors shared by the two probands.
+    ancestors_1 = hpo_graph.get_ancestors_of_terms(proband_1)
+    ancestors_2 = hpo_graph.get_ancestors_of_terms(proband_2)
     
-    return max(ic)
+    return max([hpo_graph.calculate_information_content(x)
+        for x in ancestors_1 & ancestors_2])
 
 def get_lin_score(hpo_graph, proband_1, proband_2):
     """ Calculate the similarity in HPO terms between terms for two probands.
@@ -111,11 +117,13 @@ def get_simGIC_score(hpo_graph, proband_1, proband_2):
             graph_1 = hpo_graph.get_ancestors(term_1)
             graph_2 = hpo_graph.get_ancestors(term_2)
             
-            intersect = graph_1 & graph_2
-            union = graph_1 | graph_2
+            intersect = hpo_graph.sum_information_content(graph_1 & graph_2)
             
-            intersect = sum([ hpo_graph.calculate_information_content(x) for x in intersect ])
-            union = sum([ hpo_graph.calculate_information_content(x) for x in union ])
+            # the IC summed across the union of the ancestors is the IC summed
+            # across each term's ancestors, less the shared ancestors which were
+            # counted twice. That avoids building the union for every pair.
+            union = hpo_graph.get_ancestors_information_content(term_1) + \
+                hpo_graph.get_ancestors_information_content(term_2) - intersect
             
             try:
                 scores.append(intersect/union)
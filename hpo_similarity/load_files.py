@@ -19,6 +19,7 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import sys
 import json
 
 def load_participants_hpo_terms(path, alt_ids, obsolete):
@@ -50,6 +51,9 @@ def load_participants_hpo_terms(path, alt_ids, obsolete):
         # otherwise just assume it is a standard HPO ID already.
         terms = [alt_ids[term] if term in alt_ids else term for term in terms]
         
+        # intern the terms, since the same terms recur across many probands
+        terms = [sys.intern(term) for term in terms]
+        
         hpo[proband] = terms
     
     return hpo
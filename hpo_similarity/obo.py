@@ -184,12 +184,15 @@ class Parser(object):
         objects.
         """
         try:
-            fp = open(fp)
+            # obo files are UTF-8, and every line gets stripped, so skip the
+            # universal newline translation
+            fp = open(fp, encoding="utf-8", newline="")
         except TypeError:
             pass
         
         self.fp = fp
         self.line_re = re.compile(r"\s*(?P<tag>[^:]+):\s*(?P<value>.*)")
+        self.plain_string_re = re.compile(r'"(?P<value>[^"\\]*)"')
         self.lineno = 0
         self._read_headers()
 
@@ -197,11 +200,8 @@ class Parser(object):
         """Iterates over the lines of the file, removing
         comments and trailing newlines and merging multi-line
         tag-value pairs into a single line"""
-        while True:
+        for line in self.fp:
             self.lineno += 1
-            line = self.fp.readline()
-            if not line: break
-
             line = line.strip()
             if not line:
                 yield line
@@ -247,13 +247,20 @@ class Parser(object):
         # If the value starts with a quotation mark, we parse it as a
         # Python string -- luckily this is the same as an OBO string
         if value_and_mod and value_and_mod[0] == '"':
-            g = tokenize.generate_tokens(StringIO(value_and_mod).readline)
-            for toknum, tokval, _, (erow, ecol), _ in g:
-                if toknum == tokenize.STRING:
-                    value = eval(tokval)
-                    mod = (value_and_mod[ecol:].strip(), )
-                    break
-                raise ParseError("cannot parse string literal", self.lineno)
+            # Most quoted values have no escape sequences, so they can be
+            # taken verbatim without tokenizing and evaluating the literal
+            plain = self.plain_string_re.match(value_and_mod)
+            if plain and not value_and_mod.startswith('"""'):
+                value = plain.group("value")
+                mod = (value_and_mod[plain.end():].strip(), )
+            else:
+                g = tokenize.generate_tokens(StringIO(value_and_mod).readline)
+                for toknum, tokval, _, (erow, ecol), _ in g:
+                    if toknum == tokenize.STRING:
+                        value = eval(tokval)
+                        mod = (value_and_mod[ecol:].strip(), )
+                        break
+                    raise ParseError("cannot parse string literal", self.lineno)
         else:
             value = value_and_mod
             mod = None
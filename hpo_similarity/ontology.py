@@ -24,14 +24,128 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+
 from pkg_resources import resource_filename
 
 from hpo_similarity.similarity import ICSimilarity
 from hpo_similarity.obo import Parser
 
+# bump this whenever the structure of the parsed obo data changes, so that
+# stale cache files are ignored
+CACHE_VERSION = 2
+
+def get_cache_path(hpo_path):
+    """ find where the parsed copy of an obo file should be cached
+    
+    The cache filename is keyed on the absolute path of the obo file, so each
+    obo file has a single cache file, which is overwritten when the obo file
+    changes. The cache directory defaults to ~/.cache/hpo_similarity, but can
+    be set with the HPO_SIMILARITY_CACHE environment variable.
+    
+    Args:
+        hpo_path: path to HPO obo formatted file
+    
+    Returns:
+        path to the pickled cache file for the obo file
+    """
+    
+    cache_dir = os.environ.get("HPO_SIMILARITY_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "hpo_similarity"))
+    
+    path = os.path.abspath(hpo_path)
+    digest = hashlib.sha1(path.encode("utf8")).hexdigest()
+    
+    return os.path.join(cache_dir, digest + ".pkl")
+
+def get_cache_key(hpo_path):
+    """ get a key for the version of an obo file that was parsed
+    
+    Args:
+        hpo_path: path to HPO obo formatted file
+    
+    Returns:
+        tuple of the modification time and size of the obo file, plus the cache
+        format version, which must match for a cached parse to be reused.
+    """
+    
+    stat = os.stat(hpo_path)
+    
+    return (stat.st_mtime, stat.st_size, CACHE_VERSION)
+
+def read_cache(cache_path, key):
+    """ load previously parsed obo data, if it has been cached
+    
+    Args:
+        cache_path: path to pickled cache file
+        key: cache key for the current version of the obo file
+    
+    Returns:
+        tuple of (header, entries), or None if the cache is missing, unreadable
+        or was made from a different version of the obo file
+    """
+    
+    # the cache is only a shortcut, so any problem reading it (e.g. a pickle
+    # written by a newer python, or referring to classes which have since moved)
+    # just means we parse the obo file again
+    try:
+        with open(cache_path, "rb") as handle:
+            cached = pickle.load(handle)
+        
+        if cached["key"] == key:
+            return cached["data"]
+    except Exception:
+        pass
+    
+    return None
+
+def write_cache(cache_path, key, data):
+    """ save parsed obo data, so later runs can skip parsing the obo file
+    
+    The data is written to a temporary file first, then moved into place, so
+    concurrent runs never see a partially written cache. Failing to write the
+    cache (e.g. on a read-only or full filesystem) is not an error.
+    
+    Args:
+        cache_path: path to pickled cache file
+        key: cache key for the version of the obo file that was parsed
+        data: tuple of (header, entries) to cache
+    """
+    
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        
+        handle, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except (IOError, OSError):
+        return
+    
+    # any failure while writing (e.g. a full disk, or data which can't be
+    # pickled) just leaves us without a cache, but don't leave the partially
+    # written temporary file behind
+    try:
+        with os.fdopen(handle, "wb") as output:
+            # use a fixed protocol, so the cache can be read by every python
+            # version we support, even if a newer python wrote it
+            pickle.dump({"key": key, "data": data}, output, protocol=4)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
 def load_hpo_database(hpo_path):
     """ load the human phenotype ontology (HPO) database in obo format
     
+    Parsing the obo file is slow, so the parsed entries are cached on disk, and
+    reused on later runs until the obo file changes.
+    
     Args:
         hpo_path: path to HPO obo formatted file
         
@@ -43,10 +157,16 @@ def load_hpo_database(hpo_path):
     if hpo_path is None:
         hpo_path = resource_filename(__name__, "data/hp.obo")
     
+    cache_path = get_cache_path(hpo_path)
+    key = get_cache_key(hpo_path)
+    cached = read_cache(cache_path, key)
+    if cached is not None:
+        return cached
+    
     parser = Parser(hpo_path)
-    hpo_entries = []
-    for entry in parser:
-        hpo_entries.append(entry)
+    hpo_entries = list(parser)
+    
+    write_cache(cache_path, key, (parser.headers, hpo_entries))
     
     return parser.headers, hpo_entries
 
@@ -62,11 +182,16 @@ def add_hpo_attributes_to_node(graph, node_id, obo_tags):
         nothing, updates the graph node within this function
     """
     
-    for key in obo_tags:
-        if len(obo_tags[key]) > 1:
-            graph.node[node_id][key] = [str(ot) for ot in obo_tags[key]]
+    # build all the attributes first, then set them on the node in one go,
+    # rather than looking the node up again for every tag
+    attributes = {}
+    for key, values in obo_tags.items():
+        if len(values) > 1:
+            attributes[key] = [str(ot) for ot in values]
         else:
-            graph.node[node_id][key] = str(obo_tags[key][0])
+            attributes[key] = str(values[0])
+    
+    graph.node[node_id].update(attributes)
 
 def is_obsolete(obo_tags):
     """ checks if an "is_obsolete" flag is in the tags for an obo entry
@@ -94,7 +219,7 @@ def track_alt_ids(alt_ids, obo_tags, node_id):
     # make sure we can convert between the alternate IDs and their HPO ID
     if "alt_id" in obo_tags:
         for alt_id in obo_tags["alt_id"]:
-            alt_id = str(alt_id)
+            alt_id = sys.intern(str(alt_id))
             alt_ids[alt_id] = node_id
 
 def add_entry(graph, entry, alt_ids, obsolete_ids):
@@ -112,7 +237,9 @@ def add_entry(graph, entry, alt_ids, obsolete_ids):
         obsolete_ids.add(str(tags["id"][0]))
         return
     
-    node_id = str(tags["id"][0])
+    # intern the HPO IDs, so that the many references to each term (as node
+    # IDs, edges and proband terms) share a single string object
+    node_id = sys.intern(str(tags["id"][0]))
     graph.add_node(node_id)
     
     # make sure we can convert between HPO ID and their alternate IDs
@@ -124,7 +251,7 @@ def add_entry(graph, entry, alt_ids, obsolete_ids):
     # add the predecessors to the node
     if "is_a" in tags:
         for predecessor in tags["is_a"]:
-            predecessor = str(predecessor)
+            predecessor = sys.intern(str(predecessor))
             graph.add_edge(predecessor, node_id)
 
 def open_ontology(path=None):
@@ -36,6 +36,7 @@ class CalculateSimilarity(DiGraph):
     def __init__(self):
         self.descendant_cache = {}
         self.ancestor_cache = {}
+        self.terms_ancestor_cache = {}
         
         self.total_freq = 0
         
@@ -89,10 +90,7 @@ class CalculateSimilarity(DiGraph):
         if term not in self:
             return
         
-        if 'sample_ids' not in self.node[term]:
-            self.node[term]['sample_ids'] = set([])
-        
-        self.node[term]['sample_ids'].add(proband)
+        self.node[term].setdefault('sample_ids', set()).add(proband)
     
     def get_descendants(self, term):
         """ finds the set of subterms that descend from a top level HPO term
@@ -111,7 +109,7 @@ class CalculateSimilarity(DiGraph):
             extra = [ self.get_descendants(x) for x in terms ]
             terms |= set([item for sublist in extra for item in sublist])
             
-            self.descendant_cache[term] = terms
+            self.descendant_cache[term] = frozenset(terms)
         
         return self.descendant_cache[term]
     
@@ -138,10 +136,37 @@ class CalculateSimilarity(DiGraph):
             subterms |= set([item for sublist in extra for item in sublist])
             
             subterms.add(bottom_term)
-            self.ancestor_cache[bottom_term] = subterms
+            self.ancestor_cache[bottom_term] = frozenset(subterms)
         
         return self.ancestor_cache[bottom_term]
     
+    def get_ancestors_of_terms(self, terms):
+        """ finds the set of HPO terms that are ancestors of any of a set of terms
+        
+        The same combinations of terms recur (e.g. the same proband is sampled
+        many times when simulating similarity scores), so the ancestors are
+        cached for each distinct set of terms.
+        
+        Args:
+            terms: list of hpo terms, e.g. the terms for a single proband. Terms
+                which are not in the graph are ignored.
+        
+        Returns:
+            frozenset of ancestor HPO terms (including the terms themselves)
+        """
+        
+        terms = frozenset(terms)
+        
+        if terms not in self.terms_ancestor_cache:
+            ancestors = set()
+            for term in terms:
+                if term in self:
+                    ancestors |= self.get_ancestors(term)
+            
+            self.terms_ancestor_cache[terms] = frozenset(ancestors)
+        
+        return self.terms_ancestor_cache[terms]
+    
     def find_common_ancestors(self, term_1, term_2):
         """ finds the common ancestors of two hpo terms
         
@@ -157,7 +182,7 @@ class CalculateSimilarity(DiGraph):
         if term_1 not in self or term_2 not in self:
             return set()
         
-        return set(self.get_ancestors(term_1)) & set(self.get_ancestors(term_2))
+        return self.get_ancestors(term_1) & self.get_ancestors(term_2)
 
 
 class ICSimilarity(CalculateSimilarity):
@@ -217,6 +242,42 @@ class ICSimilarity(CalculateSimilarity):
         
         return self.node[term]['info_content']
     
+    def sum_information_content(self, terms):
+        """ sums the information content across a set of hpo terms
+        
+        This uses math.fsum, so that the total does not depend on the order in
+        which we iterate over the set of terms.
+        
+        Args:
+            terms: set of hpo terms, e.g. {"HP:0000001", "HP:0000118"}
+        
+        Returns:
+            the total information content of the terms
+        """
+        
+        return math.fsum([self.calculate_information_content(x) for x in terms])
+    
+    def get_ancestors_information_content(self, term):
+        """ sums the information content across a term and its ancestors
+        
+        Args:
+            term: hpo term, eg "HP:0000001"
+        
+        Returns:
+            the total information content of the term and its ancestors
+        """
+        
+        if term not in self:
+            return 0
+        
+        if 'ancestors_info_content' not in self.node[term]:
+            # cache the total, so we only sum the ancestors once per term
+            ancestors = self.get_ancestors(term)
+            self.node[term]['ancestors_info_content'] = \
+                self.sum_information_content(ancestors)
+        
+        return self.node[term]['ancestors_info_content']
+    
     def get_term_count(self, term):
         """ Count how many times a term (or its subterms) was used.
         
@@ -52,7 +52,13 @@ def test_similarity(hpo_graph, hpo_by_proband, probands, n_sims, score_type="res
     """
     
     probands = [hpo_by_proband[x] for x in probands if x in hpo_by_proband]
-    other_probands = [x for x in hpo_by_proband if x not in probands]
+    
+    # The null distribution samples from every proband with HPO terms, which
+    # includes the probands for the current gene. That has always been the
+    # behaviour (the P values and unit tests rely on it), so it is kept. Hold
+    # the term lists in a list, so that each simulation samples term lists
+    # directly, rather than sampling proband IDs and looking each one up again.
+    all_probands = list(hpo_by_proband.values())
     
     # We can't test similarity from a single proband. We don't call this
     # function for genes with a single proband, however, sometimes only one of
@@ -66,8 +72,7 @@ def test_similarity(hpo_graph, hpo_by_proband, probands, n_sims, score_type="res
     # get a distribution of scores for randomly sampled HPO terms
     distribution = []
     for x in range(n_sims):
-        sampled = random.sample(other_probands, len(probands))
-        simulated = [hpo_by_proband[n] for n in sampled]
+        simulated = random.sample(all_probands, len(probands))
         predicted = get_proband_similarity(hpo_graph, simulated, score_type)
         distribution.append(predicted)
     
@@ -20,8 +20,17 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import os
+import re
+import csv
 import json
 import argparse
+from operator import itemgetter
+
+# HPO terms within a field are separated by "|", or occasionally by ";"
+HPO_SEPARATOR = re.compile(r"\s*[|;]\s*")
+
+# placeholder values used for probands without any HPO terms
+MISSING_TERMS = frozenset(["NA", "", "-", "."])
 
 def get_options():
     
@@ -39,6 +48,28 @@ def get_options():
     
     return args
 
+def find_columns(header, labels):
+    """ find the positions of columns within a header line
+    
+    Args:
+        header: list of column labels from the first line of a table
+        labels: list of column labels to find
+    
+    Returns:
+        list of column positions, in the same order as the labels
+    
+    Raises:
+        ValueError if any of the labels are missing from the header
+    """
+    
+    positions = dict((label, i) for i, label in enumerate(header))
+    
+    missing = [x for x in labels if x not in positions]
+    if len(missing) > 0:
+        raise ValueError("missing columns: {0}".format(", ".join(missing)))
+    
+    return [positions[x] for x in labels]
+
 def prepare_participants_hpo_terms(pheno_path, alt_id_path, trio_path, output_path):
     """ loads patient HPO terms
     
@@ -54,38 +85,43 @@ def prepare_participants_hpo_terms(pheno_path, alt_id_path, trio_path, output_pa
     trio_probands = load_trio_probands(trio_path)
     
     # load the phenotype data for each participant
-    handle = open(pheno_path, "r")
-    
-    # get the positions of the columns in the list of header labels
-    header = handle.readline().strip().split("\t")
-    proband_column = header.index("patient_id")
-    child_hpo_column = header.index("child_hpo")
-    
-    hpo_by_proband = {}
-    for line in handle:
-        line = line.split("\t")
-        proband_id = line[proband_column]
-        child_terms = line[child_hpo_column]
-        
-        # don't use probands who lack HPO terms
-        if child_terms == "NA" or child_terms == '' or child_terms == '-':
-            continue
-        
-        # swap the proband across to the DDD ID if it exists
-        if proband_id in alt_ids:
-            proband_id = alt_ids[proband_id]
+    with open(pheno_path, "r", newline="", buffering=1 << 20) as handle:
+        reader = csv.reader(handle, delimiter="\t", quoting=csv.QUOTE_NONE)
         
-        # if we are only looking at probands in the trios, make sure that the
-        # current proband is one from a trio.
-        if trio_probands is not None and proband_id not in trio_probands:
-            continue
+        # get the positions of the columns in the list of header labels
+        header = next(reader)
+        proband_column, child_hpo_column = find_columns(header,
+            ["patient_id", "child_hpo"])
         
-        if "|" in child_terms:
-            child_terms = child_terms.split("|")
-        else:
-            child_terms = [child_terms]
+        # the phenotype table is wide, but we only need two of its columns, so
+        # pull just those out of each row
+        get_columns = itemgetter(proband_column, child_hpo_column)
         
-        hpo_by_proband[proband_id] = child_terms
+        hpo_by_proband = {}
+        for proband_id, child_terms in map(get_columns, reader):
+            # don't use probands who lack HPO terms
+            child_terms = child_terms.strip()
+            if child_terms in MISSING_TERMS:
+                continue
+            
+            # swap the proband across to the DDD ID if it exists
+            if proband_id in alt_ids:
+                proband_id = alt_ids[proband_id]
+            
+            # if we are only looking at probands in the trios, make sure that
+            # the current proband is one from a trio.
+            if trio_probands is not None and proband_id not in trio_probands:
+                continue
+            
+            # a field with a single term splits to a one-item list, so this
+            # needs no special case, and the regex strips whitespace around
+            # each term
+            child_terms = HPO_SEPARATOR.split(child_terms)
+            child_terms = [x for x in child_terms if x]
+            if len(child_terms) == 0:
+                continue
+            
+            hpo_by_proband[proband_id] = child_terms
     
     with open(output_path, "w") as output:
         json.dump(hpo_by_proband, output, indent=4, sort_keys=True)
@@ -106,13 +142,13 @@ def load_alt_id_map(alt_id_path):
     if alt_id_path is None:
         return alt_ids
     
-    with open(alt_id_path) as handle:
-        header = handle.readline().strip().split('\t')
-        decipher_col = header.index('decipher_id')
-        ddd_col = header.index('person_stable_id')
+    with open(alt_id_path, newline="") as handle:
+        reader = csv.reader(handle, delimiter="\t", quoting=csv.QUOTE_NONE)
+        header = next(reader)
+        decipher_col, ddd_col = find_columns(header,
+            ['decipher_id', 'person_stable_id'])
         
-        for line in handle:
-            line = line.split("\t")
+        for line in reader:
             ref_id = line[ddd_col]
             alt_id = line[decipher_col]
             
@@ -134,9 +170,8 @@ def load_trio_probands(trio_path):
         return None
     
     proband_ids = set()
-    with open(trio_path) as handle:
-        for line in handle:
-            line = line.split("\t")
+    with open(trio_path, newline="") as handle:
+        for line in csv.reader(handle, delimiter="\t", quoting=csv.QUOTE_NONE):
             proband_ids.add(line[1])
     
     return proband_ids
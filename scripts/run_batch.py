@@ -47,7 +47,7 @@ def get_bjobs():
     
     command = ["bjobs", "-o", "\"JOBID", "USER", "STAT", "QUEUE", "JOB_NAME", "delimiter=';'\""]
     command = " ".join(command)
-    output = subprocess.check_output(command, shell=True, stderr=open(os.devnull, "w"))
+    output = subprocess.check_output(command, shell=True, stderr=subprocess.DEVNULL)
     
     bjobs = []
     for line in output.split("\n"):
@@ -0,0 +1,10 @@
+import os
+import atexit
+import shutil
+import tempfile
+
+# keep the parsed ontology caches written while testing out of the user's home
+# directory, and remove them once the tests finish
+CACHE_DIR = tempfile.mkdtemp(prefix="hpo_similarity_tests.")
+os.environ["HPO_SIMILARITY_CACHE"] = CACHE_DIR
+atexit.register(shutil.rmtree, CACHE_DIR, ignore_errors=True)
@@ -21,6 +21,8 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os
 import math
+import shutil
+import tempfile
 import unittest
 
 from hpo_similarity.ontology import open_ontology
@@ -28,6 +30,7 @@ from hpo_similarity.similarity import ICSimilarity
 from hpo_similarity.get_scores import get_resnik_score, get_simGIC_score, \
     get_proband_similarity
 from hpo_similarity.test_similarity import test_similarity
+from hpo_similarity.analyse_genes import analyse_genes
 
 class TestHpoSimilarityPy(unittest.TestCase):
     """ class to test hpo similarity fucntions
@@ -106,3 +109,33 @@ class TestHpoSimilarityPy(unittest.TestCase):
         p = test_similarity(self.hpo_graph, self.hpo_terms, probands, n_sims=1000, score_type="resnik")
         self.assertLess(abs(p - 0.999), 0.03)
         
+    
+    def test_analyse_genes_processes(self):
+        """ check that analyse_genes gives the same output with several processes
+        """
+        
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        
+        # include a gene with a single proband, which shouldn't be tested
+        probands_by_gene = {"GENE_B": ["person_02", "person_03"],
+            "GENE_A": ["person_01", "person_03"], "GENE_C": ["person_01"]}
+        
+        results = {}
+        for processes in [1, 2]:
+            path = os.path.join(temp_dir, "{0}.txt".format(processes))
+            analyse_genes(self.hpo_graph, self.hpo_terms, probands_by_gene,
+                path, 100, "resnik", processes=processes)
+            
+            with open(path) as handle:
+                results[processes] = [x.rstrip("\n").split("\t") for x in handle]
+        
+        # the P values are simulated, so can differ between runs, but the
+        # header and genes (in sorted order) should match
+        for processes in results:
+            lines = results[processes]
+            self.assertEqual(lines[0], ["hgnc", "hpo_similarity_p_value"])
+            self.assertEqual([x[0] for x in lines[1:]], ["GENE_A", "GENE_B"])
+            
+            for gene, p_value in lines[1:]:
+                self.assertTrue(0 < float(p_value) <= 1)
@@ -99,3 +99,33 @@ class TestICSimilarityPy(unittest.TestCase):
         # check the most informative information content for two identical nodes
         self.assertAlmostEqual(self.hpo_graph.get_most_informative_ic("HP:0000924", \
             "HP:0000924"), -math.log(1/3.0))
+    
+    def test_sum_information_content(self):
+        """ check that sum_information_content works correctly
+        """
+        
+        # an empty set of terms has no information content
+        self.assertEqual(self.hpo_graph.sum_information_content(set()), 0)
+        
+        # the top nodes have an IC of 0, so only the rarer terms contribute
+        terms = set(["HP:0000001", "HP:0000118", "HP:0000707", "HP:0000924"])
+        self.assertAlmostEqual(self.hpo_graph.sum_information_content(terms), \
+            -math.log(2/3.0) + -math.log(1/3.0))
+    
+    def test_get_ancestors_information_content(self):
+        """ check that get_ancestors_information_content works correctly
+        """
+        
+        # the top node is its own only ancestor, and has an IC of 0
+        self.assertEqual(self.hpo_graph.get_ancestors_information_content("HP:0000001"), 0)
+        
+        # check a terminal node, whose ancestors (bar itself) have an IC of 0
+        self.assertAlmostEqual(self.hpo_graph.get_ancestors_information_content("HP:0000924"), \
+            -math.log(1/3.0))
+        
+        # check a node with an informative ancestor
+        self.assertAlmostEqual(self.hpo_graph.get_ancestors_information_content("HP:0002011"), \
+            2 * -math.log(2/3.0))
+        
+        # terms missing from the graph have no information content
+        self.assertEqual(self.hpo_graph.get_ancestors_information_content("HP:9999999"), 0)
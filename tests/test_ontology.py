@@ -20,12 +20,16 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 import os
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 
 import networkx
 
 from hpo_similarity.ontology import (load_hpo_database, open_ontology,
-    track_alt_ids, add_hpo_attributes_to_node, is_obsolete, add_entry)
+    track_alt_ids, add_hpo_attributes_to_node, is_obsolete, add_entry,
+    get_cache_path, write_cache)
 from hpo_similarity.obo import Stanza, Value
 
 # define the header that will be parsed from the test obo dataset
@@ -94,6 +98,95 @@ class TestOntologyPy(unittest.TestCase):
         self.assertEqual(header, HEADER)
         self.assertEqual(hpo_list, HPO_LIST)
     
+    def use_temp_cache(self):
+        """ point the obo cache at an empty temporary directory for a test
+        
+        Returns:
+            path to the temporary cache directory
+        """
+        
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        
+        patcher = mock.patch.dict(os.environ, {"HPO_SIMILARITY_CACHE": cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        return cache_dir
+    
+    def test_load_hpo_database_cache(self):
+        """ check that parsed obo data is cached, and reloaded from the cache
+        """
+        
+        cache_dir = self.use_temp_cache()
+        
+        cache_path = get_cache_path(self.path)
+        self.assertEqual(os.path.dirname(cache_path), cache_dir)
+        self.assertFalse(os.path.exists(cache_path))
+        
+        # the first load parses the obo file, and writes the cache
+        self.assertEqual(load_hpo_database(self.path), (HEADER, HPO_LIST))
+        self.assertTrue(os.path.exists(cache_path))
+        
+        # the second load comes from the cache, but gives the same data
+        self.assertEqual(load_hpo_database(self.path), (HEADER, HPO_LIST))
+    
+    def test_load_hpo_database_bad_cache(self):
+        """ check that an unreadable cache file falls back to parsing the obo
+        """
+        
+        self.use_temp_cache()
+        
+        # write a pickle with an unsupported protocol number, as if it had
+        # been written by a newer python
+        cache_path = get_cache_path(self.path)
+        with open(cache_path, "wb") as handle:
+            handle.write(b"\x80\xff")
+        
+        self.assertEqual(load_hpo_database(self.path), (HEADER, HPO_LIST))
+    
+    def test_load_hpo_database_cache_updates(self):
+        """ check that editing the obo file replaces its cache, not adds to it
+        """
+        
+        cache_dir = self.use_temp_cache()
+        
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        
+        path = os.path.join(temp_dir, "obo.txt")
+        shutil.copy(self.path, path)
+        self.assertEqual(load_hpo_database(path), (HEADER, HPO_LIST))
+        
+        # add an extra term to the obo file
+        with open(path, "a") as handle:
+            handle.write("\n[Term]\nid: HP:0000005\nname: Mode of inheritance\n")
+        
+        # the edited file is parsed again, rather than using the old cache, and
+        # the new parse overwrites the old cache file
+        header, entries = load_hpo_database(path)
+        self.assertEqual(len(entries), len(HPO_LIST) + 1)
+        self.assertEqual(os.listdir(cache_dir),
+            [os.path.basename(get_cache_path(path))])
+        
+        # and the cached data is used on the next load
+        self.assertEqual(load_hpo_database(path), (header, entries))
+    
+    def test_write_cache_failure(self):
+        """ check that failing to write the cache leaves no temporary files
+        """
+        
+        cache_dir = self.use_temp_cache()
+        cache_path = get_cache_path(self.path)
+        
+        # check a full disk, and data which can't be pickled
+        for error in [OSError(28, "No space left on device"), TypeError()]:
+            with mock.patch("hpo_similarity.ontology.pickle.dump",
+                    side_effect=error):
+                write_cache(cache_path, None, (HEADER, HPO_LIST))
+            
+            self.assertEqual(os.listdir(cache_dir), [])
+    
     def test_add_hpo_attributes_to_node(self):
         """ test that add_hpo_attributes_to_node works correctly
         """
@@ -129,6 +129,25 @@ class TestCalculateSimilarityPy(unittest.TestCase):
         self.assertEqual(self.graph.get_ancestors("HP:0000001"), \
             set(['HP:0000001']))
     
+    def test_get_ancestors_of_terms(self):
+        """ check that get_ancestors_of_terms works correctly
+        """
+        
+        # check that we get the union of the ancestors for each term
+        self.assertEqual(self.graph.get_ancestors_of_terms(["HP:0000924", \
+            "HP:0002011"]), set(['HP:0000001', 'HP:0000118', 'HP:0000924', \
+            'HP:0000707', 'HP:0002011']))
+        
+        # check that terms missing from the graph are ignored
+        self.assertEqual(self.graph.get_ancestors_of_terms(["HP:0000924", \
+            "HP:9999999"]), set(['HP:0000001', 'HP:0000118', 'HP:0000924']))
+        
+        # check that the same set of terms gives the same cached object, even
+        # if the terms are in a different order
+        first = self.graph.get_ancestors_of_terms(["HP:0000924", "HP:0000707"])
+        second = self.graph.get_ancestors_of_terms(["HP:0000707", "HP:0000924"])
+        self.assertIs(first, second)
+    
     def test_find_common_ancestors(self):
         """ check that find_common_ancestors works correctly
         """